@@ -3,33 +3,26 @@
 Fix the path for NaviGPTCore.swift in the Xcode project
 """
 
-import sys
-import os
+from pbxproj_edit import Project, project_file
 
-project_file = '/Users/sohambhowmick/Desktop/NaviGPT/NaviGPT-main/NaviGPT_build_from_here/NaviGPT.xcodeproj/project.pbxproj'
+def fix_path(project):
+    """Report the NaviGPTCore.swift references; the path needs no rewriting
 
-# Read current project file
-with open(project_file, 'r') as f:
-    content = f.read()
+    The reference already uses the bare file name, which resolves relative
+    to the NaviGPT group, so there is nothing to replace and the project
+    file is left untouched.
+    """
+    if project.contains('NaviGPTCore.swift'):
+        print("Found NaviGPTCore.swift references in project file")
 
-# Fix the path - it should be relative to the NaviGPT directory
-# Replace the absolute path with just the filename
-content = content.replace(
-    'path = NaviGPTCore.swift;',
-    'path = NaviGPTCore.swift;'
-)
+        # Find the file reference entry
+        lines = project.content[:].decode().split('\n')
+        for i, line in enumerate(lines):
+            if 'NaviGPTCore.swift' in line:
+                print(f"Line {i}: {line}")
 
-# Actually, let's look for the NaviGPTCore.swift reference and see what's there
-if 'NaviGPTCore.swift' in content:
-    print("Found NaviGPTCore.swift references in project file")
-    
-    # Find the file reference entry
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        if 'NaviGPTCore.swift' in line:
-            print(f"Line {i}: {line}")
+if __name__ == '__main__':
+    with Project(project_file) as project:
+        fix_path(project)
 
-with open(project_file, 'w') as f:
-    f.write(content)
-
-print("Project file checked/updated")
+    print("Project file checked, no changes needed")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Shared editor for the NaviGPT Xcode project file
+
+Project maps project.pbxproj read-only, queues any number of edits in
+memory and writes the file back once when the block exits, so several
+scripts can share a single read and write:
+
+    with Project(project_file) as project:
+        add_phase_files_to_xcode.add_files_to_project(project)
+        add_phase3_files_to_xcode.add_files_to_project(project)
+
+Run as a module it keeps one Project open for a whole session and reads
+commands from stdin, one per line, so a workflow pays for startup and
+loading once however many edits it makes:
+
+    ADD_FILE name=Foo.swift group=NaviGPT/Services target=NaviGPT
+    REMOVE name=Bar.swift
+    COMMIT
+
+COMMIT writes the pending edits; anything left at end of input is
+committed the same way.
+
+    printf 'ADD_FILE name=Foo.swift\nCOMMIT\n' | python3 -m pbxproj_edit
+"""
+
+import functools
+import mmap
+import os
+import plistlib
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+# Get the project directory dynamically
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_dir = os.path.join(script_dir, 'NaviGPT_build_from_here')
+project_file = os.path.join(project_dir, 'NaviGPT.xcodeproj/project.pbxproj')
+
+BUILD_FILE_SECTION = b'/* Begin PBXBuildFile section */'
+FILE_REFERENCE_SECTION = b'/* Begin PBXFileReference section */'
+
+# Line templates, filled with bytes %-formatting
+BUILD_FILE_LINE = b'\t\t%b /* %b in Sources */ = {isa = PBXBuildFile; fileRef = %b /* %b */; };\n'
+FILE_REFERENCE_LINE = (b'\t\t%b /* %b */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; '
+                       b'path = %b; sourceTree = "<group>"; };\n')
+GROUP_CHILD_LINE = b'\t\t\t\t%b /* %b */,\n'
+SOURCES_FILE_LINE = b'\t\t\t\t%b /* %b in Sources */,\n'
+
+# name/path values of every object, quoted or not
+NAME_OR_PATH = re.compile(rb'\b(?:name|path) = "?([^";]+)"?;')
+
+def generate_uuid():
+    """Generate a UUID in Xcode format (24 uppercase hex chars from 12 random bytes)"""
+    return os.urandom(12).hex().upper()
+
+def write_project(path, content):
+    """Write the buffer straight to the file descriptor, bypassing buffered IO"""
+    fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+    try:
+        with memoryview(content) as view:
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def load_pbxproj(path):
+    """Parse the project with plutil into a dict whose objects are keyed by UUID"""
+    result = subprocess.run(['plutil', '-convert', 'xml1', '-o', '-', path],
+                            capture_output=True, check=True)
+    return plistlib.loads(result.stdout)
+
+@functools.lru_cache(maxsize=None)
+def reference_line(file_names):
+    """Compiled pattern for every line referencing one of file_names, cached per name tuple
+
+    Only whole file names count: an object comment (/* Name */ or
+    /* Name in Sources */) or a name/path value ending in the name, so
+    View.swift does not match ContentView.swift.
+    """
+    names = b'|'.join(re.escape(name.encode()) for name in file_names)
+    return re.compile(
+        rb'(?m)^.*(?:/\* (?:' + names + rb')(?: in \w+)? \*/'
+        rb'|\b(?:name|path) = "?(?:[^";\n]*/)?(?:' + names + rb')"?;).*(?:\n|\Z)')
+
+def find_first(content, needles):
+    """Offset of the first occurrence of each needle (-1 if absent)"""
+    # One bytes.find per needle: CPython's fast search beats a regex alternation,
+    # which tries every alternative at every position
+    return {needle: content.find(needle) for needle in needles}
+
+def definition_marker(object_uuid):
+    """Start of the line defining an object (only definitions start at two tabs)"""
+    return b'\n\t\t' + object_uuid.encode() + b' '
+
+def after_header(content, section_pos):
+    """Position just after the section header line found at section_pos"""
+    if section_pos == -1:
+        return -1
+    return content.find(b'\n', section_pos) + 1
+
+def closing_line(content, list_start):
+    """Start of the line holding the ');' that closes the list opened at list_start"""
+    if list_start == -1:
+        return -1
+    return content.rfind(b'\n', 0, content.find(b');', list_start)) + 1
+
+def list_end(content, definition_pos, list_key):
+    """Insert position at the end of a list (children/files) of the object defined at definition_pos"""
+    if definition_pos == -1:
+        return -1
+    return closing_line(content, content.find(list_key, definition_pos))
+
+def describe_anchor(anchor):
+    """Readable name of a pending insert position, for error messages"""
+    if anchor[0] == 'section':
+        return anchor[1].decode()
+    return f"the {anchor[2].decode().rstrip(' =(')} list of {anchor[1]}"
+
+def splice_all(content, edits):
+    """Insert each (offset, data) edit in place, highest offset first
+
+    Offsets refer to content before any edit. Working from the end means no
+    insertion moves an offset that is still to be applied, and each tail
+    move only covers bytes past its own insertion point.
+    """
+    for offset, data in sorted(edits, key=lambda edit: edit[0], reverse=True):
+        content[offset:offset] = data
+
+class Project:
+    """project.pbxproj held in memory between entering and leaving a with block
+
+    content starts out as a read-only mmap of the file, so lookups never
+    copy or decode it; the first edit swaps in a bytearray copy.
+    """
+
+    def __init__(self, path=project_file):
+        self.path = path
+        self.content = None
+        self._map = None
+        self._modified = False
+        self._project = None
+        self._file_names = None
+        # New lines per insert position; each batch is inserted in place once
+        self._pending = defaultdict(list)
+
+    def __enter__(self):
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            # An empty file cannot be mapped
+            if os.fstat(fd).st_size:
+                self._map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                self.content = self._map
+            else:
+                self.content = bytearray()
+        finally:
+            # mmap holds its own duplicate of the descriptor
+            os.close(fd)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.save()
+        finally:
+            self._unmap()
+        return False
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _update(self, content):
+        """Swap in an edited in-memory copy and release the read-only mapping"""
+        self.content = content
+        self._modified = True
+        self._unmap()
+
+    @property
+    def objects(self):
+        """Parsed object graph, loaded on first use"""
+        if self._project is None:
+            self._project = load_pbxproj(self.path)
+        return self._project['objects']
+
+    @property
+    def file_names(self):
+        """Set of file names the project references, indexed in one regex scan"""
+        if self._file_names is None:
+            self._file_names = {os.path.basename(match.decode())
+                                for match in NAME_OR_PATH.findall(self.content)}
+        return self._file_names
+
+    def contains(self, file_name):
+        """Whether the project already references a file called file_name"""
+        return file_name in self.file_names
+
+    def group(self, *path):
+        """UUID of the group reached by following path from the main group, or None"""
+        objects = self.objects
+        group_uuid = objects[self._project['rootObject']]['mainGroup']
+        for name in path:
+            children = objects[group_uuid].get('children', [])
+            group_uuid = next((child_uuid for child_uuid in children
+                               if objects.get(child_uuid, {}).get('isa') == 'PBXGroup'
+                               and name in (objects[child_uuid].get('path'), objects[child_uuid].get('name'))),
+                              None)
+            if group_uuid is None:
+                return None
+        return group_uuid
+
+    def sources_phase(self, target_name):
+        """UUID of the PBXSourcesBuildPhase of the named native target, or None"""
+        objects = self.objects
+        for target in objects.values():
+            if target.get('isa') == 'PBXNativeTarget' and target.get('name') == target_name:
+                for phase_uuid in target.get('buildPhases', []):
+                    if objects[phase_uuid].get('isa') == 'PBXSourcesBuildPhase':
+                        return phase_uuid
+        return None
+
+    def add_file_reference(self, file_name):
+        """Queue a PBXFileReference for a Swift file; returns its UUID"""
+        file_ref_uuid = generate_uuid()
+        name = file_name.encode()
+        self.file_names.add(file_name)
+        self._pending[('section', FILE_REFERENCE_SECTION)].append(
+            FILE_REFERENCE_LINE % (file_ref_uuid.encode(), name, name))
+        return file_ref_uuid
+
+    def add_build_file(self, file_name, file_ref_uuid):
+        """Queue a PBXBuildFile for a file reference; returns its UUID"""
+        build_file_uuid = generate_uuid()
+        name = file_name.encode()
+        self._pending[('section', BUILD_FILE_SECTION)].append(
+            BUILD_FILE_LINE % (build_file_uuid.encode(), name, file_ref_uuid.encode(), name))
+        return build_file_uuid
+
+    def add_to_group(self, group_uuid, file_ref_uuid, file_name):
+        """Queue a file reference for the end of a group's children"""
+        self._pending[('list', group_uuid, b'children = (')].append(
+            GROUP_CHILD_LINE % (file_ref_uuid.encode(), file_name.encode()))
+
+    def add_to_sources_phase(self, phase_uuid, build_file_uuid, file_name):
+        """Queue a build file for the end of a Sources build phase's files"""
+        self._pending[('list', phase_uuid, b'files = (')].append(
+            SOURCES_FILE_LINE % (build_file_uuid.encode(), file_name.encode()))
+
+    def add_source_file(self, file_name, group_uuid, phase_uuid):
+        """Queue a Swift file's reference, build file, group child and Sources entry
+
+        Returns (file_ref_uuid, build_file_uuid), or None when the project
+        already references the file. Raises ValueError if the group or
+        Sources phase is missing, rather than queueing half an entry.
+        """
+        if group_uuid is None or phase_uuid is None:
+            raise ValueError(f"No group or Sources build phase to add {file_name} to")
+        if self.contains(file_name):
+            return None
+        file_ref_uuid = self.add_file_reference(file_name)
+        build_file_uuid = self.add_build_file(file_name, file_ref_uuid)
+        self.add_to_group(group_uuid, file_ref_uuid, file_name)
+        self.add_to_sources_phase(phase_uuid, build_file_uuid, file_name)
+        return file_ref_uuid, build_file_uuid
+
+    def remove(self, *file_names):
+        """Drop every line referencing any of file_names in a single regex pass
+
+        Queued insertions are applied first so edits take effect in the
+        order they were made. Returns the number of lines removed.
+        """
+        if not file_names or not all(file_names):
+            raise ValueError("remove() needs at least one non-empty file name")
+        self.flush()
+        content, removed = reference_line(file_names).subn(b'', self.content)
+        if removed:
+            self._update(bytearray(content))
+            self._file_names = None
+        return removed
+
+    def _insert_positions(self):
+        """Insert position of every pending anchor, each marker searched for once"""
+        markers = {}
+        for anchor in self._pending:
+            if anchor[0] == 'section':
+                markers[anchor] = anchor[1]
+            elif anchor[1] is not None:
+                markers[anchor] = definition_marker(anchor[1])
+        found = find_first(self.content, markers.values())
+        positions = {}
+        for anchor in self._pending:
+            marker_pos = found[markers[anchor]] if anchor in markers else -1
+            if anchor[0] == 'section':
+                positions[anchor] = after_header(self.content, marker_pos)
+            else:
+                positions[anchor] = list_end(self.content, marker_pos, anchor[2])
+        return positions
+
+    def flush(self):
+        """Apply the queued insertions, one in-place splice per insert position
+
+        Raises ValueError, leaving the project untouched, if any insert
+        position cannot be found.
+        """
+        if not self._pending:
+            return
+        # Offsets are taken from the untouched (possibly still mapped) buffer
+        positions = self._insert_positions()
+        missing = [describe_anchor(anchor) for anchor, pos in positions.items() if pos == -1]
+        if missing:
+            raise ValueError(f"Could not find {', '.join(missing)} in {self.path}")
+        edits = [(positions[anchor], b''.join(lines))
+                 for anchor, lines in self._pending.items()]
+        content = bytearray(self.content) if self._map is not None else self.content
+        splice_all(content, edits)
+        self._pending.clear()
+        self._update(content)
+
+    def save(self):
+        """Apply queued edits and write the project back only if anything changed"""
+        self.flush()
+        if self._modified:
+            write_project(self.path, self.content)
+        self._modified = False
+
+def valid_file_name(name):
+    """Whether name is a bare file name with an extension, e.g. Foo.swift"""
+    base, extension = os.path.splitext(name)
+    return bool(base) and bool(extension) and '/' not in name
+
+def run_session(project, commands, out=sys.stdout):
+    """Apply session commands to an open Project, reporting one line per command"""
+    for line in commands:
+        if not line.strip():
+            continue
+        command, *fields = line.split()
+        args = dict(field.split('=', 1) for field in fields if '=' in field)
+        name = args.get('name')
+
+        if command in ('ADD_FILE', 'REMOVE') and not valid_file_name(name or ''):
+            print(f"error {command} needs name=<file name with extension>: {line.strip()}", file=out)
+            continue
+
+        try:
+            if command == 'ADD_FILE':
+                group = project.group(*args.get('group', 'NaviGPT').split('/'))
+                phase = project.sources_phase(args.get('target', 'NaviGPT'))
+                if group is None or phase is None:
+                    print(f"error unknown group or target for {name}", file=out)
+                elif project.add_source_file(name, group, phase) is None:
+                    print(f"skipped {name} already in project", file=out)
+                else:
+                    print(f"added {name}", file=out)
+            elif command == 'REMOVE':
+                if project.remove(name):
+                    print(f"removed {name}", file=out)
+                else:
+                    print(f"skipped {name} not in project", file=out)
+            elif command == 'COMMIT':
+                project.save()
+                print("committed", file=out)
+            else:
+                print(f"error unrecognised command: {line.strip()}", file=out)
+        except ValueError as e:
+            print(f"error {e}", file=out)
+
+if __name__ == '__main__':
+    with Project(project_file) as project:
+        run_session(project, sys.stdin)
@@ -3,28 +3,17 @@
 Remove NaviGPTCore.swift references from Xcode project
 """
 
-import sys
-import os
+from pbxproj_edit import Project, project_file
 
-project_file = '/Users/sohambhowmick/Desktop/NaviGPT/NaviGPT-main/NaviGPT_build_from_here/NaviGPT.xcodeproj/project.pbxproj'
+# Files whose references should be dropped
+removed_files = ['NaviGPTCore.swift']
 
-# Read current project file
-with open(project_file, 'r') as f:
-    content = f.read()
+if __name__ == '__main__':
+    with Project(project_file) as project:
+        # Remove NaviGPTCore.swift references
+        removed = project.remove(*removed_files)
 
-# Remove NaviGPTCore.swift references
-lines = content.split('\n')
-new_lines = []
-
-for line in lines:
-    # Skip lines containing NaviGPTCore.swift
-    if 'NaviGPTCore.swift' not in line:
-        new_lines.append(line)
-
-content = '\n'.join(new_lines)
-
-# Write back
-with open(project_file, 'w') as f:
-    f.write(content)
-
-print("✅ Removed NaviGPTCore.swift references from project")
+    if removed:
+        print(f"✅ Removed {removed} NaviGPTCore.swift reference lines from project")
+    else:
+        print("No NaviGPTCore.swift references in project, nothing removed")
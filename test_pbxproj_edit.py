@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for pbxproj_edit against a small fixture project
+
+Run with: python3 -m unittest test_pbxproj_edit
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pbxproj_edit
+from pbxproj_edit import Project, run_session
+
+FIXTURE = b'''// !$*UTF8*$!
+{
+	objects = {
+
+/* Begin PBXBuildFile section */
+		B00000000000000000000001 /* ContentView.swift in Sources */ = {isa = PBXBuildFile; fileRef = F00000000000000000000001 /* ContentView.swift */; };
+		B00000000000000000000002 /* MapsView.swift in Sources */ = {isa = PBXBuildFile; fileRef = F00000000000000000000002 /* MapsView.swift */; };
+/* End PBXBuildFile section */
+
+/* Begin PBXFileReference section */
+		F00000000000000000000001 /* ContentView.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = ContentView.swift; sourceTree = "<group>"; };
+		F00000000000000000000002 /* MapsView.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = MapsView.swift; sourceTree = "<group>"; };
+/* End PBXFileReference section */
+
+/* Begin PBXGroup section */
+		G00000000000000000000000 = {
+			isa = PBXGroup;
+			children = (
+				G00000000000000000000001 /* NaviGPT */,
+			);
+			sourceTree = "<group>";
+		};
+		G00000000000000000000001 /* NaviGPT */ = {
+			isa = PBXGroup;
+			children = (
+				F00000000000000000000001 /* ContentView.swift */,
+				F00000000000000000000002 /* MapsView.swift */,
+			);
+			path = NaviGPT;
+			sourceTree = "<group>";
+		};
+/* End PBXGroup section */
+
+/* Begin PBXNativeTarget section */
+		T00000000000000000000001 /* NaviGPT */ = {
+			isa = PBXNativeTarget;
+			buildPhases = (
+				S00000000000000000000001 /* Sources */,
+			);
+			name = NaviGPT;
+		};
+/* End PBXNativeTarget section */
+
+/* Begin PBXSourcesBuildPhase section */
+		S00000000000000000000001 /* Sources */ = {
+			isa = PBXSourcesBuildPhase;
+			files = (
+				B00000000000000000000001 /* ContentView.swift in Sources */,
+				B00000000000000000000002 /* MapsView.swift in Sources */,
+			);
+		};
+/* End PBXSourcesBuildPhase section */
+	};
+	rootObject = P00000000000000000000001 /* Project object */;
+}
+'''
+
+# What plutil would report for FIXTURE
+FIXTURE_OBJECTS = {
+    'rootObject': 'P00000000000000000000001',
+    'objects': {
+        'P00000000000000000000001': {'isa': 'PBXProject', 'mainGroup': 'G00000000000000000000000'},
+        'G00000000000000000000000': {'isa': 'PBXGroup', 'children': ['G00000000000000000000001']},
+        'G00000000000000000000001': {'isa': 'PBXGroup', 'path': 'NaviGPT',
+                                     'children': ['F00000000000000000000001', 'F00000000000000000000002']},
+        'T00000000000000000000001': {'isa': 'PBXNativeTarget', 'name': 'NaviGPT',
+                                     'buildPhases': ['S00000000000000000000001']},
+        'S00000000000000000000001': {'isa': 'PBXSourcesBuildPhase',
+                                     'files': ['B00000000000000000000001', 'B00000000000000000000002']},
+    },
+}
+
+class ProjectTestCase(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.pbxproj')
+        os.close(handle)
+        self.write(FIXTURE)
+        patcher = mock.patch.object(pbxproj_edit, 'load_pbxproj', return_value=FIXTURE_OBJECTS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(os.remove, self.path)
+
+    def write(self, content):
+        with open(self.path, 'wb') as f:
+            f.write(content)
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def session(self, *commands):
+        """Run commands through one session and return its output lines"""
+        out = io.StringIO()
+        with Project(self.path) as project:
+            run_session(project, [command + '\n' for command in commands], out)
+        return out.getvalue().splitlines()
+
+class SessionTests(ProjectTestCase):
+
+    def test_add_file_writes_all_four_entries(self):
+        self.assertEqual(self.session('ADD_FILE name=Qux.swift', 'COMMIT'), ['added Qux.swift', 'committed'])
+        content = self.read()
+        self.assertEqual(content.count(b'Qux.swift'), 6)
+        self.assertEqual(content.count(b'/* Qux.swift in Sources */'), 2)
+        # The group child and Sources entry close their lists
+        self.assertIn(b'/* MapsView.swift */,\n\t\t\t\t', content)
+        self.assertIn(b'/* Qux.swift */,\n\t\t\t);', content)
+        self.assertIn(b'/* Qux.swift in Sources */,\n\t\t\t);', content)
+
+    def test_remove_after_add_applies_in_order(self):
+        output = self.session('ADD_FILE name=Qux.swift', 'REMOVE name=Qux.swift', 'COMMIT')
+        self.assertEqual(output, ['added Qux.swift', 'removed Qux.swift', 'committed'])
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_re_adding_a_file_is_skipped(self):
+        output = self.session('ADD_FILE name=Qux.swift', 'COMMIT', 'ADD_FILE name=Qux.swift')
+        self.assertEqual(output[-1], 'skipped Qux.swift already in project')
+        self.assertEqual(self.session('ADD_FILE name=ContentView.swift'),
+                         ['skipped ContentView.swift already in project'])
+        self.assertEqual(self.read().count(b'Qux.swift'), 6)
+
+    def test_re_add_after_unrelated_remove_is_skipped(self):
+        self.session('ADD_FILE name=Qux.swift', 'REMOVE name=ContentView.swift', 'ADD_FILE name=Qux.swift')
+        content = self.read()
+        self.assertEqual(content.count(b'Qux.swift'), 6)
+        self.assertNotIn(b'ContentView.swift', content)
+
+    def test_remove_matches_whole_file_names_only(self):
+        self.assertEqual(self.session('REMOVE name=View.swift'), ['skipped View.swift not in project'])
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_empty_or_extensionless_names_are_rejected(self):
+        output = self.session('REMOVE name=', 'ADD_FILE name=', 'ADD_FILE name=swift', 'REMOVE')
+        self.assertEqual(len(output), 4)
+        self.assertTrue(all(line.startswith('error ') for line in output))
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_unknown_group_is_reported(self):
+        self.assertEqual(self.session('ADD_FILE name=Qux.swift group=Missing'),
+                         ['error unknown group or target for Qux.swift'])
+        self.assertEqual(self.read(), FIXTURE)
+
+class ProjectTests(ProjectTestCase):
+
+    def test_remove_without_names_raises(self):
+        with Project(self.path) as project:
+            with self.assertRaises(ValueError):
+                project.remove()
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_remove_drops_last_line_without_newline(self):
+        self.write(b'keep\n\t\tpath = Gone.swift;')
+        with Project(self.path) as project:
+            self.assertEqual(project.remove('Gone.swift'), 1)
+        self.assertEqual(self.read(), b'keep\n')
+
+    def test_missing_anchor_raises_and_leaves_file_untouched(self):
+        with self.assertRaises(ValueError):
+            with Project(self.path) as project:
+                file_ref_uuid = project.add_file_reference('Qux.swift')
+                project.add_to_group('G0000000000000000000FFFF', file_ref_uuid, 'Qux.swift')
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_add_source_file_rejects_missing_group(self):
+        with Project(self.path) as project:
+            with self.assertRaises(ValueError):
+                project.add_source_file('Qux.swift', None, 'S00000000000000000000001')
+        self.assertEqual(self.read(), FIXTURE)
+
+    def test_splice_all_uses_original_offsets(self):
+        content = bytearray(b'abcdef')
+        pbxproj_edit.splice_all(content, [(2, b'X'), (4, b'YY'), (0, b'Z')])
+        self.assertEqual(content, bytearray(b'ZabXcdYYef'))
+
+    def test_find_first(self):
+        self.assertEqual(pbxproj_edit.find_first(b'abcabc', [b'bc', b'zz']), {b'bc': 1, b'zz': -1})
+
+if __name__ == '__main__':
+    unittest.main()